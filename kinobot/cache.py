@@ -11,6 +11,8 @@ from .constants import CACHE_DIR
 MEDIA_LIST_TIME = datetime.timedelta(hours=1).total_seconds()
 PATREON_MEMBERS_TIME = datetime.timedelta(minutes=10).total_seconds()
 TOP_TIME = MEDIA_LIST_TIME  # Temporary
+TMDB_META_TIME = datetime.timedelta(days=30).total_seconds()
+YT_TITLE_TIME = datetime.timedelta(days=7).total_seconds()
 
 os.makedirs(CACHE_DIR, exist_ok=True)
 
@@ -17,11 +17,9 @@ from .constants import (
     DISCORD_PUBLIC_TOKEN_TEST,
     KINOBASE,
 )
-from .db import Kinobase
-from .discord.admin import run as arun
-from .discord.public import run as prun
-from .jobs import sched
-from .register import EpisodeRegister, MediaRegister
+# The subcommand imports (discord bots, scheduler, registers) are deferred
+# into each command so every invocation only pays for what it runs
+from .db import Execute, Kinobase
 from .utils import create_needed_folders, init_rotating_log, init_log
 
 logger = logging.getLogger(__name__)
@@ -58,12 +56,16 @@ def cli(
 
     create_needed_folders()
 
+    Execute().create_indexes()  # "if not exists"; cheap once created
+
 
 @click.command()
 @click.option("--prefix", default="!", help="Command prefix.")
 @click.option("--token", help="Server token.")
 def admin(prefix: str, token: Optional[str] = None):
     "Run the admin tasks Discord bot."
+    from .discord.admin import run as arun
+
     arun(token or DISCORD_ADMIN_TOKEN, prefix)
 
 
@@ -71,6 +73,8 @@ def admin(prefix: str, token: Optional[str] = None):
 @click.option("--name", default="test", help="Bot's name (public, test, foreign)")
 def public(name: str):
     "Run the public Discord bot."
+    from .discord.public import run as prun
+
     token = _BOTS[name]
     logger.debug("Starting %s bot", name)
     prun(token, token == DISCORD_PUBLIC_FOREIGN_TOKEN)
@@ -80,6 +84,8 @@ def public(name: str):
 @click.option("--all-media", is_flag=True, help="Add media without subtitles.")
 def register(all_media: bool = False):
     "Register media to the database."
+    from .register import EpisodeRegister, MediaRegister
+
     for media in (MediaRegister, EpisodeRegister):
         handler = media(only_w_subtitles=not all_media)
         handler.load_new_and_deleted()
@@ -89,4 +95,6 @@ def register(all_media: bool = False):
 @click.command()
 def bot():
     "Run the Facebook bot."
+    from .jobs import sched
+
     sched.start()
@@ -5,12 +5,43 @@
 
 import logging
 import sqlite3
+import threading
 from typing import List, Sequence
 
 from .constants import KINOBASE
 
 logger = logging.getLogger(__name__)
 
+_local = threading.local()
+
+
+def _get_connection(database: str) -> sqlite3.Connection:
+    """Get a per-thread connection for a database path.
+
+    Opening a connection per statement paid setup and page-cache warmup
+    on every query; reusing one per thread makes the small lookups
+    page-cache reads.
+
+    :param database:
+    :type database: str
+    :rtype: sqlite3.Connection
+    """
+    try:
+        connections = _local.connections
+    except AttributeError:
+        connections = _local.connections = {}
+
+    conn = connections.get(database)
+    if conn is None:
+        logger.debug("Opening connection: %s", database)
+        conn = sqlite3.connect(database)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.set_trace_callback(logger.debug)
+        connections[database] = conn
+
+    return conn
+
 
 class Kinobase:
     "Base class for Kinobot's database interaction."
@@ -21,22 +52,19 @@ class Kinobase:
     table = "movies"
 
     def _execute_many(self, sql: str, seq_of_params: Sequence[tuple]):
-        with sqlite3.connect(self.__database__) as conn:
-            conn.execute("PRAGMA journal_mode=WAL")
-            conn.set_trace_callback(logger.debug)
+        conn = _get_connection(self.__database__)
+        with conn:  # Commits the transaction, as before
             conn.executemany(sql, seq_of_params)
 
     def _fetch(self, sql: str, params: tuple) -> tuple:
-        with sqlite3.connect(self.__database__) as conn:
-            conn.execute("PRAGMA journal_mode=WAL")
-            conn.set_trace_callback(logger.debug)
+        conn = _get_connection(self.__database__)
+        with conn:
             return conn.execute(sql, params).fetchone()
 
     def _execute_sql(self, sql: str, params: tuple):
         logger.debug("Database path: %s", self.__database__)
-        with sqlite3.connect(self.__database__) as conn:
-            conn.execute("PRAGMA journal_mode=WAL")
-            conn.set_trace_callback(logger.debug)
+        conn = _get_connection(self.__database__)
+        with conn:
             conn.execute(sql, params)
 
     def _db_command_to_dict(
@@ -48,7 +76,13 @@ class Kinobase:
         return sql_to_dict(self.__database__, sql, params)
 
     def _insert(self):
-        self._execute_sql(self._get_insert_command(), self._get_sqlite_tuple())
+        cls = type(self)
+        # The command is constant per class; build it once (checked on
+        # cls.__dict__ so subclasses with another table don't inherit it)
+        if cls.__dict__.get("_insert_sql") is None:
+            cls._insert_sql = self._get_insert_command()
+
+        self._execute_sql(cls._insert_sql, self._get_sqlite_tuple())
 
     def _update(self, id_):
         command = (
@@ -68,19 +102,17 @@ class Kinobase:
         return tuple(getattr(self, attr) for attr in self.__insertables__)
 
     def _sql_to_dict(self, sql: str, params: tuple = ()):
-        with sqlite3.connect(self.__database__) as conn:
-            conn.execute("PRAGMA journal_mode=WAL")
-            conn.set_trace_callback(logger.debug)
-            conn.row_factory = sqlite3.Row
+        conn = _get_connection(self.__database__)
 
-            conn_ = conn.cursor()
+        conn_ = conn.cursor()
+        conn_.row_factory = sqlite3.Row
 
-            conn_.execute(sql, params)
-            logger.debug("Params: %s", params)
+        conn_.execute(sql, params)
+        logger.debug("Params: %s", params)
 
-            fetched = conn_.fetchall()
+        fetched = conn_.fetchall()
 
-            return [dict(row) for row in fetched]
+        return [dict(row) for row in fetched]
 
     def _set_attrs_to_values(self, item: dict):
         for key, val in item.items():
@@ -100,6 +132,21 @@ class Execute(Kinobase):
         sql = f"select count(id) from {table} where used='0' and verified=?"
         return self._fetch(sql, (verified,))[0]
 
+    def create_indexes(self):
+        "Create indexes for the most frequent lookup columns."
+        for sql in (
+            "create index if not exists idx_requests_user_id on requests (user_id)",
+            "create index if not exists idx_requests_used_verified on requests (used, verified)",
+            "create index if not exists idx_posts_request_id on posts (request_id)",
+            "create index if not exists idx_movies_tmdb on movies (tmdb)",
+            "create index if not exists idx_movies_title on movies (title)",
+            "create index if not exists idx_movies_path on movies (path)",
+            "create index if not exists idx_episodes_path on episodes (path)",
+            "create index if not exists idx_movie_credits_people_id on movie_credits (people_id)",
+            "create index if not exists idx_episode_credits_people_id on episode_credits (people_id)",
+        ):
+            self._execute_sql(sql, ())
+
 
 def sql_to_dict(
     database: str,
@@ -115,16 +162,14 @@ def sql_to_dict(
     :rtype: List[dict]
     """
     database = database or KINOBASE
-    with sqlite3.connect(database) as conn:
-        conn.execute("PRAGMA journal_mode=WAL")
-        conn.set_trace_callback(logger.debug)
-        conn.row_factory = sqlite3.Row
+    conn = _get_connection(database)
 
-        conn_ = conn.cursor()
+    conn_ = conn.cursor()
+    conn_.row_factory = sqlite3.Row
 
-        conn_.execute(sql, params)
-        logger.debug("Params: %s", params)
+    conn_.execute(sql, params)
+    logger.debug("Params: %s", params)
 
-        fetched = conn_.fetchall()
+    fetched = conn_.fetchall()
 
-        return [dict(row) for row in fetched]
+    return [dict(row) for row in fetched]
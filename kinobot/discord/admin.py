@@ -6,6 +6,7 @@
 # Discord bot for admin tasks.
 
 import asyncio
+import functools
 import logging
 
 from discord import Member
@@ -29,6 +30,7 @@ from .chamber import Chamber
 from .chamber import CollaborativeChamber
 from .common import get_req_id_from_ctx
 from .common import handle_error
+from .common import install_uvloop
 from .extras.curator import MovieView
 from .extras.curator import RadarrClient
 from .extras.curator import register_movie_addition
@@ -43,6 +45,10 @@ logging.getLogger("discord").setLevel(logging.INFO)
 
 logger = logging.getLogger(__name__)
 
+# Before the Bot object: discord.py captures the running event loop on
+# construction, so installing uvloop any later is a no-op
+install_uvloop()
+
 bot = commands.Bot(command_prefix="!")
 
 
@@ -67,7 +73,11 @@ async def verify(ctx: commands.Context, id_: str):
             f"WARNING: verifying your own requests "
             "is FORBIDDEN unless you have direct admin permission."
         )
-        send_webhook(
+        # Off the event loop: the webhook call blocks and may sleep on 429s
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(
+            None,
+            send_webhook,
             DISCORD_ANNOUNCER_WEBHOOK,
             f"**WARNING:** {ctx.author.display_name} verified their own request: **{req.pretty_title}**",
         )
@@ -150,8 +160,10 @@ async def fsub(ctx: commands.Context, *args):
     else:
         item = Movie.from_query(query)
 
-    subs = pysubs2.load(item.subtitle)
-    subs.shift(s=sec, ms=mss)
+    # File I/O and subtitle parsing are blocking; keep them off the loop
+    loop = asyncio.get_running_loop()
+    subs = await loop.run_in_executor(None, pysubs2.load, item.subtitle)
+    await loop.run_in_executor(None, functools.partial(subs.shift, s=sec, ms=mss))
 
     await ctx.send(f"Shifted `{sec}s:{mss}ms`. Type `reset` to restore it.")
 
@@ -159,13 +171,15 @@ async def fsub(ctx: commands.Context, *args):
         msg = await bot.wait_for("message", timeout=60, check=_check_botmin)
 
         if "reset" in msg.content.lower().strip():
-            subs.shift(s=-sec, ms=-mss)
+            await loop.run_in_executor(
+                None, functools.partial(subs.shift, s=-sec, ms=-mss)
+            )
             await ctx.send("Restored.")
 
     except asyncio.TimeoutError:
         pass
 
-    subs.save(item.subtitle)
+    await loop.run_in_executor(None, subs.save, item.subtitle)
 
     await ctx.send(f"Subtitles updated for `{item.pretty_title}`.")
 
@@ -250,7 +264,15 @@ async def _interactive_y_n(ctx):
 
 
 async def _pretty_title_list(ctx, items, append=None):
-    str_list = "\n".join(f"{n}. {m.pretty_title()}" for n, m in enumerate(items, 1))
+    # pretty_title may hit metadata endpoints; build the listing off the
+    # event loop
+    loop = asyncio.get_running_loop()
+    str_list = await loop.run_in_executor(
+        None,
+        lambda: "\n".join(
+            f"{n}. {m.pretty_title()}" for n, m in enumerate(items, 1)
+        ),
+    )
     msg = f"Choose the item you want to add ('n' to ignore):\n\n{str_list}"
 
     if append is not None:
@@ -276,8 +298,13 @@ def _pretty_gbs(bytes_):
 
 @bot.command(name="addm", help="Add a movie to the database.")
 async def addmovie(ctx: commands.Context, *args):
+    # One session for the whole command instead of reconnecting per check
     with Curator(ctx.author.id, KINOBASE) as curator:
-        size_left = curator.size_left()
+        await _addmovie(ctx, curator, *args)
+
+
+async def _addmovie(ctx: commands.Context, curator: Curator, *args):
+    size_left = curator.size_left()
 
     if size_left < _MIN_BYTES:
         return await ctx.send(
@@ -370,9 +397,8 @@ async def addmovie(ctx: commands.Context, *args):
 
     register_movie_addition(user.id, chosen_movie_view.tmdb_id)
 
-    with Curator(ctx.author.id, KINOBASE) as curator:
-        curator.register_addition(model_1.size, "Made via curator command")
-        new_size_left = curator.size_left()
+    curator.register_addition(model_1.size, "Made via curator command")
+    new_size_left = curator.size_left()
 
     await ctx.send(
         f"Getting the release. Let's wait.\nGBs left: {_pretty_gbs(new_size_left)}"
@@ -380,10 +406,13 @@ async def addmovie(ctx: commands.Context, *args):
 
     await asyncio.sleep(10)
 
-    retries = 0
     grabbed_event_sent = False
 
-    while 45 > retries:
+    # Poll with exponential backoff instead of hammering Radarr every minute
+    delay, elapsed = 5.0, 0.0
+    timeout = 2700
+
+    while timeout > elapsed:
         events = await loop.run_in_executor(
             None, client.events_in_history, result["id"]
         )
@@ -399,8 +428,9 @@ async def addmovie(ctx: commands.Context, *args):
             else:
                 logger.debug("Unknown event: %s", event)
 
-        retries += 1
-        await asyncio.sleep(60)
+        await asyncio.sleep(delay)
+        elapsed += delay
+        delay = min(120, delay * 1.5)
 
     if grabbed_event_sent:
         await ctx.reply(
@@ -416,7 +446,11 @@ async def addmovie(ctx: commands.Context, *args):
 @bot.command(name="addtv", help="Add a TV Show's season to the database.")
 async def addtvshow(ctx: commands.Context, *args):
     with Curator(ctx.author.id, KINOBASE) as curator:
-        size_left = curator.size_left()
+        await _addtvshow(ctx, curator, *args)
+
+
+async def _addtvshow(ctx: commands.Context, curator: Curator, *args):
+    size_left = curator.size_left()
 
     if size_left < _MIN_BYTES:
         return await ctx.send(
@@ -514,9 +548,8 @@ async def addtvshow(ctx: commands.Context, *args):
 
     register_tv_show_season_addition(user.id, chosen_tv.tvdb_id, chosen_season)
 
-    with Curator(ctx.author.id, KINOBASE) as curator:
-        curator.register_addition(model_1.size, "Made via curator command")
-        new_size_left = curator.size_left()
+    curator.register_addition(model_1.size, "Made via curator command")
+    new_size_left = curator.size_left()
 
     await ctx.send(
         f"Getting the release. Let's wait.\nGBs left: {_pretty_gbs(new_size_left)} "
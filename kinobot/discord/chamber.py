@@ -21,6 +21,7 @@ from ..utils import send_webhook
 from .common import get_req_id_from_ctx
 
 _GOOD_BAD_NEUTRAL_EDIT = ("🇼", "🇱", "🧊", "✏️")
+_GOOD_BAD_NEUTRAL_EDIT_SET = frozenset(_GOOD_BAD_NEUTRAL_EDIT)
 _ICE_DELAY = datetime.timedelta(days=1)
 
 
@@ -167,7 +168,7 @@ class Chamber:
             logger.info("Sending image: %s", image)
             message = await self.ctx.send(file=File(image))
 
-        assert [await message.add_reaction(emoji) for emoji in _GOOD_BAD_NEUTRAL_EDIT]
+        await _add_reactions(message, _GOOD_BAD_NEUTRAL_EDIT)
 
     async def _verdict(self):
         "raises asyncio.TimeoutError"
@@ -252,9 +253,7 @@ class Chamber:
         message = await self.ctx.send(
             f"Continue in the chamber of {self._req_cls.table}? ({queued} verified)."
         )
-        assert [
-            await message.add_reaction(emoji) for emoji in _GOOD_BAD_NEUTRAL_EDIT[:2]
-        ]
+        await _add_reactions(message, _GOOD_BAD_NEUTRAL_EDIT[:2])
 
         try:
             reaction, user = await self.bot.wait_for(
@@ -327,7 +326,7 @@ class _FakeChamber(Chamber):
 
     async def _send_info(self):
         message = await self.ctx.send("This is a fake request.")
-        assert [await message.add_reaction(emoji) for emoji in _GOOD_BAD_NEUTRAL_EDIT]
+        await _add_reactions(message, _GOOD_BAD_NEUTRAL_EDIT)
 
 
 # class Chamber(_FakeChamber):
@@ -338,16 +337,20 @@ class CollaborativeChamber(Chamber):
     def __init__(self, bot, ctx, members):
         super().__init__(bot, ctx)
         self._members = members
+        # Computed once as every reaction/message event checks against them
+        self._member_ids_ = frozenset(str(member.id) for member in members)
+        self._mentions_ = " ".join(f"<@{member.id}>" for member in members)
         self._first_req = True
 
     @classmethod
-    async def from_bot(cls, bot, ctx, partners, roles=("verifier", "botmin")):
+    async def from_bot(cls, bot, ctx, partners, roles=frozenset(("verifier", "botmin"))):
         if not partners:
             raise KinoException(
                 f"You need to tag at least one verifier partner (e.g. !chamber @dummy @dummy_2)"
             )
 
         members = [ctx.author]
+        member_ids = {str(ctx.author.id)}
 
         for partner in partners:
             partner = partner.strip()
@@ -362,9 +365,10 @@ class CollaborativeChamber(Chamber):
             if not any(str(role.name) in roles for role in member.roles):
                 raise KinoException(f"{partner} isn't allowed to enter the chamber")
 
-            if str(member.id) in (str(mem.id) for mem in members):
+            if str(member.id) in member_ids:
                 raise KinoException(f"You can't add duplicate verifiers.")
 
+            member_ids.add(str(member.id))
             members.append(member)
 
         return cls(bot, ctx, members)
@@ -403,9 +407,7 @@ class CollaborativeChamber(Chamber):
             f"{self._mentions_str()} Continue in the chamber of {self._req_cls.table}? "
             f"({queued} verified). Absolute majority!"
         )
-        assert [
-            await message.add_reaction(emoji) for emoji in _GOOD_BAD_NEUTRAL_EDIT[:2]
-        ]
+        await _add_reactions(message, _GOOD_BAD_NEUTRAL_EDIT[:2])
 
         collected_reacts = await self._collect_reacts()
 
@@ -521,7 +523,7 @@ class CollaborativeChamber(Chamber):
     def _check_react(self, reaction, user):
         return (
             str(user.id) in self._member_ids()
-            and str(reaction) in _GOOD_BAD_NEUTRAL_EDIT
+            and str(reaction) in _GOOD_BAD_NEUTRAL_EDIT_SET
         )
 
     def _check_msg_author(self, author):
@@ -534,15 +536,20 @@ class CollaborativeChamber(Chamber):
         )
 
     def _member_ids(self):
-        return (str(member.id) for member in self._members)
+        return self._member_ids_
 
     def _mentions_str(self):
-        return " ".join(f"<@{member.id}>" for member in self._members)
+        return self._mentions_
 
     def _verdict_author(self):
         return ", ".join(member.display_name for member in self._members)
 
 
+async def _add_reactions(message, emojis):
+    "Add the reactions concurrently instead of paying one RTT per emoji."
+    await asyncio.gather(*(message.add_reaction(emoji) for emoji in emojis))
+
+
 def _user_str_list(user_list):
     user_list = {user: user_list.count(user) for user in user_list}
     user_list = {
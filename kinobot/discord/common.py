@@ -1,4 +1,5 @@
 import logging
+from functools import lru_cache
 
 import aiohttp
 from discord import DiscordException, Embed, Forbidden
@@ -68,13 +69,28 @@ def _exception_embed(exception):
     return embed
 
 
+def install_uvloop():
+    "Use uvloop's event loop if it's available."
+    try:
+        import uvloop
+    except ImportError:
+        logger.debug("uvloop not installed")
+    else:
+        uvloop.install()
+        logger.debug("uvloop installed")
+
+
 _req_id_map = {"spanish": "es", "brazilian": "pt", "old-page": "main"}
 
 
-def get_req_id_from_ctx(ctx):
-    channel_name = ctx.channel.name.lower()
+@lru_cache(maxsize=None)
+def _get_req_id_from_channel(channel_name: str) -> str:
     for key, val in _req_id_map.items():
         if channel_name.startswith(key):
             return val
 
     return "en"
+
+
+def get_req_id_from_ctx(ctx):
+    return _get_req_id_from_channel(ctx.channel.name.lower())
@@ -32,13 +32,17 @@ from ..search import (
 from ..top import TopMovies
 from ..user import User
 from ..utils import get_args_and_clean
-from .common import handle_error, get_req_id_from_ctx
+from .common import handle_error, get_req_id_from_ctx, install_uvloop
 from .request import Static, StaticForeign
 
 logging.getLogger("discord").setLevel(logging.INFO)
 
 logger = logging.getLogger(__name__)
 
+# Before the Bot object: discord.py captures the running event loop on
+# construction, so installing uvloop any later is a no-op
+install_uvloop()
+
 bot = commands.Bot(command_prefix="!")
 
 
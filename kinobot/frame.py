@@ -9,6 +9,7 @@ import os
 import re
 import textwrap
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from functools import cached_property
 from typing import Generator, List, Optional, Sequence, Tuple, Union
 
@@ -39,7 +40,7 @@ from .utils import download_image, get_dar
 _UPPER_SPLIT = re.compile(r"(\s*[.!?♪\-]\s*)")
 _STRANGE_RE = re.compile(r"[^a-zA-ZÀ-ú0-9?!\.\ \¿\?',&-_*(\n)]")
 _BAD_DOTS = re.compile(r"(?u)\.{2,}")
-_STYLE = re.compile(r"<.*?>")
+_STYLE = re.compile(r"<[^>]*>")  # Linear; no backtracking on unbalanced tags
 _EXTRA_SPACE = re.compile(" +")
 
 _REPLACEMENTS = (
@@ -341,15 +342,14 @@ class GIF:
         start, end = self._start_end_gif_timestamp()
 
         logger.info("Start: %d - end: %d", start, end)
+        pos: Optional[int] = None
         for i in range(start, end, 4):
-            path = os.path.join(CACHED_FRAMES_DIR, f"{basename_}_{start}_gif.jpg")
+            path = os.path.join(CACHED_FRAMES_DIR, f"{basename_}_{i}_gif.jpg")
             if os.path.isfile(path):
                 logger.debug("Cached image found")
                 yield Image.open(path)
             else:
-                self.media.capture.set(1, i)
-
-                frame_ = self.media.capture.read()[1]
+                frame_, pos = _grab_frame(self.media.capture, pos, i)
                 frame_ = _load_pil_from_cv2(_scale_to_gif(_fix_dar(frame_, dar)))
                 frame_.save(path)
                 yield frame_
@@ -365,19 +365,19 @@ class GIF:
 
         dar = get_dar(self.media.path)
 
+        pos: Optional[int] = None
         for subtitle in self.subtitles:
             start, end = self._start_end_gif_quote(subtitle)
             end += 10
             end = end if abs(start - end) < 100 else (start + 100)
             logger.info("Start: %d - end: %d", start, end)
             for i in range(start, end, 4):
-                path = os.path.join(CACHED_FRAMES_DIR, f"{basename_}_{start}_gif.jpg")
+                path = os.path.join(CACHED_FRAMES_DIR, f"{basename_}_{i}_gif.jpg")
                 if os.path.isfile(path):
                     logger.debug("Cached image found")
                     image = Image.open(path)
                 else:
-                    self.media.capture.set(1, i)
-                    frame_ = self.media.capture.read()[1]
+                    frame_, pos = _grab_frame(self.media.capture, pos, i)
                     image = _load_pil_from_cv2(_scale_to_gif(_fix_dar(frame_, dar)))
                     image.save(path)
 
@@ -797,10 +797,16 @@ class Static:
                 images[0].save(single_img)
             else:
                 self._paths.pop(0)
-                for num, image in enumerate(images):
-                    path_ = os.path.join(path, f"{num:02}.{IMAGE_EXTENSION}")
-                    image.save(path_)
-                    self._paths.append(path_)
+                paths = [
+                    os.path.join(path, f"{num:02}.{IMAGE_EXTENSION}")
+                    for num in range(len(images))
+                ]
+                # Pillow's encoder releases the GIL, so the saves scale
+                # across cores
+                with ThreadPoolExecutor(max_workers=len(images)) as executor:
+                    list(executor.map(Image.Image.save, images, paths))
+
+                self._paths.extend(paths)
 
         logger.debug("Final paths: %s", self._paths)
 
@@ -874,18 +880,33 @@ class Static:
 
         return "Category: Kinema Parallels"
 
-    def _load_frames(self):
-        logger.debug("Items: %s", self.items)
-        for request in self.items:
-            request.compute_brackets()
+    @staticmethod
+    def _load_item_frames(request) -> List[Frame]:
+        request.compute_brackets()
 
-            for frame in request.brackets:
-                frame_ = Frame(request.media, frame)
-                frame_.load_frame()
+        frames = []
+        for bracket in request.brackets:
+            frame_ = Frame(request.media, bracket)
+            frame_.load_frame()
+
+            logger.debug("Appending frame: %s", frame_)
 
-                logger.debug("Appending frame: %s", frame_)
+            frames.append(frame_)
 
-                self.frames.append(frame_)
+        return frames
+
+    def _load_frames(self):
+        logger.debug("Items: %s", self.items)
+
+        if len(self.items) == 1:
+            self.frames.extend(self._load_item_frames(self.items[0]))
+        else:
+            # Every item owns its media capture, so parallel requests can
+            # overlap their subtitle lookups and video seeks (map keeps
+            # the item order)
+            with ThreadPoolExecutor(max_workers=len(self.items)) as executor:
+                for frames in executor.map(self._load_item_frames, self.items):
+                    self.frames.extend(frames)
 
         if not self.frames:
             raise exceptions.NothingFound("No valid frames found")
@@ -896,9 +917,9 @@ class Static:
         logger.debug("Loaded frames: %s", len(self.frames))
 
     def _get_parallel_header(self) -> str:
-        titles = [item.media.parallel_title for item in self.items]
+        titles = (item.media.parallel_title for item in self.items)
         # Remove dupes
-        return " | ".join(list(dict.fromkeys(titles)))
+        return " | ".join(dict.fromkeys(titles))
 
     def __repr__(self) -> str:
         return f"<Static ({len(self.items)} items)>"
@@ -1085,13 +1106,14 @@ def _fix_dar(cv2_image, dar: float):
     """
     logger.debug("Fixing image with DAR: %s", dar)
 
-    width, height = cv2_image.shape[:2]
+    height, width = cv2_image.shape[:2]  # shape is (rows, columns)
+
+    fixed_width = int(round(height * dar))
+    if fixed_width == width:  # Already square-pixel; skip the resample
+        return cv2_image
 
-    # fix width
-    fixed_aspect = dar / (width / height)
-    width = int(width * fixed_aspect)
-    # resize with fixed width (cv2)
-    return cv2.resize(cv2_image, (width, height))
+    interpolation = cv2.INTER_AREA if fixed_width < width else cv2.INTER_CUBIC
+    return cv2.resize(cv2_image, (fixed_width, height), interpolation=interpolation)
 
 
 def _draw_quote(image: Image.Image, quote: str, modify_text: bool = True, **kwargs):
@@ -1179,6 +1201,36 @@ def _scale_to_gif(frame) -> np.ndarray:
     return cv2.resize(frame, (int(w * inc), int(h * inc)))
 
 
+_GRAB_AHEAD_LIMIT = 250  # Roughly a GOP; past that a keyframe seek wins
+
+
+def _grab_frame(capture, pos: Optional[int], target: int) -> Tuple[np.ndarray, int]:
+    """Decode the frame at target, reusing the decoder state.
+
+    capture.set restarts decoding from a keyframe on most codecs, so for
+    bursts of nearby frames it's much cheaper to walk forward with grab
+    (which doesn't decode) and retrieve only the wanted frame. Seeking is
+    left for targets behind or far ahead of the current position.
+
+    :param capture:
+    :param pos: current frame position (None for an unknown state)
+    :type pos: Optional[int]
+    :param target: wanted frame index
+    :type target: int
+    :rtype: Tuple[np.ndarray, int]
+    """
+    if pos is None or target < pos or target - pos > _GRAB_AHEAD_LIMIT:
+        capture.set(1, target)
+        pos = target
+
+    while pos <= target:
+        if not capture.grab():
+            break
+        pos += 1
+
+    return capture.retrieve()[1], pos
+
+
 def _prettify_quote(text: str) -> str:
     """
     Adjust line breaks to correctly draw a subtitle.
@@ -1195,7 +1247,7 @@ def _prettify_quote(text: str) -> str:
     if (len(lines) == 1 and len(text) > 35) or len(lines) > 2:
         final_text = _harmonic_wrap(final_text)
 
-    if len(re.findall("-", final_text)) == 1 and final_text.startswith("-"):
+    if final_text.count("-") == 1 and final_text.startswith("-"):
         final_text = final_text.replace("-", "").strip()
 
     return final_text
@@ -1265,9 +1317,11 @@ def _clean_sub(text: str) -> str:
     """
     logger.debug("About to clean subtitle: %s", text)
 
-    for replacement in _REPLACEMENTS:
-        logger.debug("Using %s replacement. Og text: %s", replacement[0], text)
-        text = re.sub(replacement[0], replacement[1], text)
+    for pattern, replacement in _REPLACEMENTS:
+        if pattern is _STYLE and "<" not in text:
+            continue  # Most subtitles carry no style tags
+
+        text = pattern.sub(replacement, text)
 
     logger.debug("Result: %s", text)
     return text.strip()
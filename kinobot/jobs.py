@@ -6,6 +6,8 @@
 import logging
 import os
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 
 from apscheduler.events import EVENT_JOB_ERROR
 from apscheduler.schedulers.blocking import BlockingScheduler
@@ -14,6 +16,7 @@ from apscheduler.triggers.cron import CronTrigger
 from .constants import FACEBOOK_URL, FACEBOOK_URL_ES, FACEBOOK_URL_MAIN, FACEBOOK_URL_PT
 from .db import Execute
 from .exceptions import KinoException, NothingFound, RecentPostFound
+from .media import release_captures
 from .poster import FBPoster, FBPosterEs, FBPosterPt
 from .register import EpisodeRegister, FacebookRegister, MediaRegister
 from .request import Request, RequestEs, RequestMain, RequestPt
@@ -26,6 +29,12 @@ sched = BlockingScheduler()
 sched.add_job(sync_local_subtitles, CronTrigger.from_crontab("*/30 * * * *"))
 
 
+def _collect_from_facebook(posts: int, identifier: str):
+    register = FacebookRegister(posts, identifier)
+    register.requests()
+    register.ratings()
+
+
 @sched.scheduled_job(CronTrigger.from_crontab("*/30 * * * *"))  # every 30 min
 def collect_from_facebook(posts: int = 40):
     """Collect new requests and ratings from the Facebook page.
@@ -33,10 +42,9 @@ def collect_from_facebook(posts: int = 40):
     :param posts:
     :type posts: int
     """
-    for identifier in ("en", "es", "pt"):
-        register = FacebookRegister(posts, identifier)
-        register.requests()
-        register.ratings()
+    # The pages are independent; overlap their network latency
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        list(executor.map(partial(_collect_from_facebook, posts), ("en", "es", "pt")))
 
 
 @sched.scheduled_job(CronTrigger.from_crontab("0 0 * * *"))  # every midnight
@@ -97,22 +105,29 @@ _fb_url_map = {
 @sched.scheduled_job(CronTrigger.from_crontab("*/30 * * * *"))  # every 30 min
 def post_to_facebook():
     "Find a valid request and post it to Facebook."
-    for identifier in ("en", "es", "pt", "main"):
-        _post_to_facebook(identifier)
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(_post_to_facebook, ("en", "es", "pt", "main")))
+
+    # The captures are useless until the next cycle; free the decoders
+    release_captures()
+
+
+def _register_media(media):
+    handler = media(only_w_subtitles=False)
+
+    try:
+        handler.load_new_and_deleted()
+        handler.handle()
+    except Exception as error:
+        logger.debug("%s raised for %s. Ignoring", error, media)
 
 
 @sched.scheduled_job(CronTrigger.from_crontab("0 * * * *"))  # every hour
 def register_media():
     "Register new media in the database."
-    for media in (MediaRegister, EpisodeRegister):
-        handler = media(only_w_subtitles=False)
-
-        try:
-            handler.load_new_and_deleted()
-            handler.handle()
-        except Exception as error:
-            logger.debug("%s raised for %s. Ignoring", error, media)
-            continue
+    # Movies and episodes scan different directories; overlap their I/O
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        list(executor.map(_register_media, (MediaRegister, EpisodeRegister)))
 
 
 def error_listener(event):
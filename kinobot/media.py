@@ -6,31 +6,35 @@
 from __future__ import annotations
 
 import datetime
+import gc
 import json
 import logging
 import os
 import re
 import sqlite3
 import subprocess
+import sys
+import threading
 import time
 import uuid
-import tempfile
+from collections import OrderedDict
 from functools import cached_property
 from typing import List, Optional, Tuple, Type, Union
-from urllib import parse
 
 import musicbrainzngs
+import numpy as np
 import requests
 import srt
 import tmdbsimple as tmdb
 from cv2 import cv2
-from discord import Embed
-from discord_webhook import DiscordEmbed
-from fuzzywuzzy import fuzz
+try:
+    from rapidfuzz import fuzz  # C++-backed drop-in for ratio
+except ImportError:
+    from fuzzywuzzy import fuzz
 
 import kinobot.exceptions as exceptions
 
-from .cache import region
+from .cache import MEDIA_LIST_TIME, YT_TITLE_TIME, region
 from .constants import (
     CACHED_FRAMES_DIR,
     FANART_BASE,
@@ -59,11 +63,74 @@ logger = logging.getLogger(__name__)
 
 _TMDB_IMG_BASE = "https://image.tmdb.org/t/p/original"
 
+# Shared by the small JSON lookups below; keep-alive skips a TLS
+# handshake per call
+_SESSION = requests.Session()
+
 _CHEVRONS_RE = re.compile("<|>")
 _YEAR_RE = re.compile(r"\(([0-9]{4})\)")
 
 EXTRACTION_TIMEOUT = datetime.timedelta(minutes=1).total_seconds()
 
+# Above the posting jobs' peak concurrency (four pages at once), so an
+# in-flight capture is never the eviction victim
+_CAPTURES_LIMIT = 8
+_captures: "OrderedDict[str, cv2.VideoCapture]" = OrderedDict()
+_captures_lock = threading.Lock()
+
+
+def _release_if_unused(capture):
+    # Releasing a capture another thread is decoding from is a native
+    # use-after-free. Three references mean the cache held the last one
+    # (the caller's local, our parameter and getrefcount's argument);
+    # any more and a LocalMedia still points at it, so drop it and let
+    # its destructor do the release.
+    if sys.getrefcount(capture) <= 3:
+        capture.release()
+
+
+def _get_capture(path: str):
+    """Get a video capture for a path, reusing recently opened ones.
+
+    Constructing a VideoCapture can take seconds and OpenCV leaks dozens
+    of MBs per unreleased instance, so keep a small LRU of open captures
+    and release the oldest on eviction.
+
+    :param path:
+    :type path: str
+    """
+    with _captures_lock:
+        try:
+            capture = _captures.pop(path)
+            logger.debug("Reusing capture for %s", path)
+        except KeyError:
+            logger.debug("Opening capture for %s", path)
+            capture = cv2.VideoCapture(path)
+
+        _captures[path] = capture
+
+        while len(_captures) > _CAPTURES_LIMIT:
+            _, oldest = _captures.popitem(last=False)
+            _release_if_unused(oldest)
+
+    return capture
+
+
+def release_captures():
+    """Release every cached video capture.
+
+    Eviction already releases the oldest captures; this drains the whole
+    cache so idle periods don't keep decoder buffers alive. The
+    collection pass takes care of backends that only free memory on
+    finalization.
+    """
+    with _captures_lock:
+        while _captures:
+            _, capture = _captures.popitem(last=False)
+            _release_if_unused(capture)
+
+    gc.collect()
+
 tmdb.API_KEY = TMDB_KEY
 
 # By running this software, you are under the agreement of:
@@ -121,7 +188,7 @@ class LocalMedia(Kinobase):
                 "Subtitles not found. Please report this to the admin."
             )
 
-        return os.path.splitext(self.path)[0] + ".en.srt"
+        return sub_file
 
     def register(self):
         "Register item in the database."
@@ -163,14 +230,13 @@ class LocalMedia(Kinobase):
         if not os.path.isfile(path):
             raise exceptions.SubtitlesNotFound(path)
 
-        with open(path, "r") as item:
-            logger.debug("Looking for subtitle file: %s", path)
-            try:
-                return list(srt.parse(item))
-            except (srt.TimestampParseError, srt.SRTParseError):
-                raise exceptions.SubtitlesNotFound(
-                    "The subtitles are corrupted. Please report this to the admin."
-                ) from None
+        logger.debug("Looking for subtitle file: %s", path)
+        try:
+            return _parse_subtitles(path, os.path.getmtime(path))
+        except (srt.TimestampParseError, srt.SRTParseError):
+            raise exceptions.SubtitlesNotFound(
+                "The subtitles are corrupted. Please report this to the admin."
+            ) from None
 
     def register_post(self, post_id: str):
         "Register a post related to the class."
@@ -217,14 +283,12 @@ class LocalMedia(Kinobase):
 
     def _get_frame_ffmpeg(self, timestamps: Tuple[int, int]):
         ffmpeg_ts = ".".join(str(int(ts)) for ts in timestamps)
-        path = os.path.join(tempfile.gettempdir(), f"kinobot_{uuid.uuid4()}.png")
 
         command = [
             "ffmpeg",
             "-y",
             "-v",
             "quiet",
-            "-stats",
             "-ss",
             ffmpeg_ts,
             "-i",
@@ -233,18 +297,23 @@ class LocalMedia(Kinobase):
             "scale=iw*sar:ih",
             "-vframes",
             "1",
-            path,
+            "-f",
+            "image2pipe",
+            "-vcodec",
+            "bmp",  # Skips the PNG encode/decode round-trip
+            "pipe:1",
         ]
 
         logger.debug("Command to run: %s", " ".join(command))
         try:
-            subprocess.run(command, timeout=EXTRACTION_TIMEOUT)
+            result = subprocess.run(
+                command, stdout=subprocess.PIPE, timeout=EXTRACTION_TIMEOUT
+            )
         except subprocess.TimeoutExpired as error:
             raise exceptions.KinoUnwantedException("Subprocess error") from error
 
-        if os.path.isfile(path):
-            frame = cv2.imread(path)
-            os.remove(path)
+        if result.stdout:
+            frame = cv2.imdecode(np.frombuffer(result.stdout, np.uint8), cv2.IMREAD_COLOR)
             if frame is not None:
                 logger.debug("OK")
                 return frame
@@ -257,7 +326,7 @@ class LocalMedia(Kinobase):
 
     def load_capture_and_fps(self):  # Still public for GIFs
         logger.info("Loading OpenCV capture and FPS for %s", self.path)
-        self.capture = cv2.VideoCapture(self.path)
+        self.capture = _get_capture(self.path)
         self.fps = self.capture.get(cv2.CAP_PROP_FPS)
 
     def _fix_dar(self, cv2_image):
@@ -266,12 +335,17 @@ class LocalMedia(Kinobase):
         """
         logger.debug("Fixing image with DAR: %s", self._dar)
 
-        width, height = cv2_image.shape[:2]
+        height, width = cv2_image.shape[:2]  # shape is (rows, columns)
 
         # fix width
-        fixed_aspect = self._dar / (width / height)
-        width = int(width * fixed_aspect)
-        return cv2.resize(cv2_image, (width, height))
+        fixed_width = int(round(height * self._dar))
+
+        if fixed_width == width:
+            logger.debug("Nothing to fix: %s", cv2_image.shape)
+            return cv2_image
+
+        interpolation = cv2.INTER_AREA if fixed_width < width else cv2.INTER_CUBIC
+        return cv2.resize(cv2_image, (fixed_width, height), interpolation=interpolation)
 
     def _get_insert_command(self) -> str:
         columns = ",".join(self.__insertables__)
@@ -321,7 +395,7 @@ class Movie(LocalMedia):
 
         self._set_attrs_to_values(kwargs)
 
-    @property
+    @cached_property
     def pretty_title(self) -> str:
         """Classic Kinobot's format title. The original title is used in the
         case of not being equal to the english title.
@@ -343,7 +417,7 @@ class Movie(LocalMedia):
 
     @overview.setter
     def overview(self, val: str):
-        self._overview = val[:250] + "..." if len(val) > 199 else ""
+        self._overview = (val[:250] + "...") if len(val) > 199 else val
 
     @property
     def parallel_title(self):
@@ -359,24 +433,36 @@ class Movie(LocalMedia):
 
         :rtype: Embed
         """
-        embed = Embed(
-            title=self.simple_title, url=self.web_url, description=self.overview
-        )
+        # Heavy import; deferred so DB-only entrypoints don't pay for it
+        from discord import Embed
 
-        if self.web_poster is not None:
-            embed.set_thumbnail(url=self.web_poster)
+        fields = [
+            {"name": "Director", "value": director.markdown_url, "inline": True}
+            for director in self.metadata.credits.directors
+        ]
+        fields.extend(dict(field, inline=True) for field in self.metadata.embed_fields)
+        fields.append(
+            {"name": "Rating", "value": str(self.metadata.rating), "inline": True}
+        )
 
-        for director in self.metadata.credits.directors:
-            embed.add_field(name="Director", value=director.markdown_url)
+        external = (self.tmdb_md, self.letterboxd_md, self.rym_md)
+        fields.append(
+            {"name": "External links", "value": " • ".join(external), "inline": True}
+        )
 
-        for field in self.metadata.embed_fields:
-            embed.add_field(**field)
+        payload: dict = {
+            "type": "rich",
+            "title": self.simple_title,
+            "url": self.web_url,
+            "description": self.overview,
+            "fields": fields,
+        }
 
-        embed.add_field(name="Rating", value=self.metadata.rating)
+        if self.web_poster is not None:
+            payload["thumbnail"] = {"url": self.web_poster}
 
-        external = (self.tmdb_md, self.letterboxd_md, self.rym_md)
-        embed.add_field(name="External links", value=" • ".join(external))
-        return embed
+        # One dict copy instead of a setter call per field
+        return Embed.from_dict(payload)
 
     @cached_property
     def webhook_embed(self) -> DiscordEmbed:
@@ -384,6 +470,8 @@ class Movie(LocalMedia):
 
         :rtype: DiscordEmbed
         """
+        from discord_webhook import DiscordEmbed
+
         embed = DiscordEmbed(
             title=self.pretty_title,
             description=self.overview,
@@ -402,7 +490,7 @@ class Movie(LocalMedia):
 
         return embed
 
-    @property
+    @cached_property
     def simple_title(self) -> str:
         """A basic title including the year.
 
@@ -432,7 +520,7 @@ class Movie(LocalMedia):
     def top_title(self) -> str:
         return f"**{self.metadata.position}.** *{self.simple_title}* (**{self.metadata.rating}**)"
 
-    @property
+    @cached_property
     def web_url(self) -> str:
         return f"{WEBSITE}/{self.type}/{self.url_clean_title}?lang={self.language}"
 
@@ -440,19 +528,19 @@ class Movie(LocalMedia):
     def relative_url(self) -> str:
         return f"/{self.type}/{self.url_clean_title}"
 
-    @property
+    @cached_property
     def markdown_url(self) -> str:
         return f"[{self.simple_title}]({self.web_url})"
 
-    @property
+    @cached_property
     def letterboxd_md(self) -> str:
         return f"[Letterboxd](https://letterboxd.com/tmdb/{self.id})"
 
-    @property
+    @cached_property
     def tmdb_md(self) -> str:
         return f"[TMDB](https://www.themoviedb.org/movie/{self.id})"
 
-    @property
+    @cached_property
     def rym_md(self) -> str:  # Experimental
         rym_title = self.og_title.replace(" ", "_").lower()
         return f"[RYM](https://rateyourmusic.com/film/{rym_title})"
@@ -520,7 +608,7 @@ class Movie(LocalMedia):
         query = query.lower().strip()
         title_query = _YEAR_RE.sub("", query).strip()
 
-        item_list = sql_to_dict(cls.__database__, "select * from movies where hidden=0")
+        item_list = _get_movie_dicts("cache")
 
         # First try to find movie by title (almost always happens)
         for item in item_list:
@@ -531,7 +619,11 @@ class Movie(LocalMedia):
         initial = 0
         final_list = []
         for item in item_list:
-            fuzzy = fuzz.ratio(query, f"{item['title'].lower()} ({item['year']})")
+            title = f"{item['title'].lower()} ({item['year']})"
+            if not _ratio_is_possible(query, title, 59):
+                continue
+
+            fuzzy = fuzz.ratio(query, title)
 
             if fuzzy > initial:
                 initial = fuzzy
@@ -663,18 +755,34 @@ class TVShow(Kinobase):
             exceptions.EpisodeNotFound
         """
         query = query.lower().strip()
-        item_list = sql_to_dict(cls.__database__, "select * from tv_shows")
+        item_list = _get_tv_show_dicts("cache")
+
+        # First try to find the show by name (almost always happens)
+        for item in item_list:
+            if query == item["name"].lower():
+                logger.debug("TV Show found by name: %s", item["name"])
+                return cls(**item)
 
         # We use loops for year and og_title matching
         initial = 0
         final_list = []
         for item in item_list:
-            fuzzy = fuzz.ratio(query, item["name"].lower())
+            title = item["name"].lower()
+            if not _ratio_is_possible(query, title, 77):
+                continue
+
+            fuzzy = fuzz.ratio(query, title)
 
             if fuzzy > initial:
                 initial = fuzzy
                 final_list.append(item)
 
+                if fuzzy > 98:  # Don't waste more time
+                    break
+
+        if not final_list:
+            raise exceptions.NothingFound
+
         item = final_list[-1]
 
         if initial < 77:
@@ -702,6 +810,8 @@ class TVShow(Kinobase):
 
     @property
     def embed(self) -> Embed:
+        from discord import Embed
+
         embed = Embed(
             title=self.simple_title, url=self.web_url, description=self.overview
         )
@@ -814,7 +924,7 @@ class Episode(LocalMedia):
 
         self._set_attrs_to_values(kwargs)
 
-    @property
+    @cached_property
     def pretty_title(self) -> str:
         """Descriptive title that includes title, season, and episode.
 
@@ -823,7 +933,7 @@ class Episode(LocalMedia):
         title = self.tv_show.title
         return f"{title}\nSeason {self.season}, Episode {self.episode}"
 
-    @property
+    @cached_property
     def simple_title(self) -> str:
         return f"{self.tv_show.title}: Season {self.season}, Episode {self.episode}"
 
@@ -831,7 +941,7 @@ class Episode(LocalMedia):
     def parallel_title(self):
         return self.tv_show.title
 
-    @property
+    @cached_property
     def web_url(self) -> str:
         return f"{WEBSITE}/{self.type}/{self.url_clean_title}"
 
@@ -851,11 +961,11 @@ class Episode(LocalMedia):
     def season_title(self):
         return f"{self.tv_show.title} season {self.season}"
 
-    @property
+    @cached_property
     def markdown_url(self) -> str:
         return f"[{self.simple_title}]({self.web_url})"
 
-    @property
+    @cached_property
     def url_clean_title(self) -> str:
         return clean_url(f"{self.pretty_title} {self.id}")
 
@@ -885,6 +995,8 @@ class Episode(LocalMedia):
 
         :rtype: Embed
         """
+        from discord import Embed
+
         embed = Embed(
             title=self.simple_title, url=self.web_url, description=self.overview
         )
@@ -977,7 +1089,7 @@ class ExternalMedia(Kinobase):
         :param query:
         :type query: str
         """
-        for sub in cls.__subclasses__():
+        for sub in _EXTERNAL_MEDIA_CLASSES:
             if f"!{sub.type}" in query:
                 return sub  # type: ignore
 
@@ -1017,22 +1129,29 @@ class ExternalMedia(Kinobase):
         timestamp = f"{seconds}.{milliseconds}"
         logger.info("Extracting %s from %s", timestamp, self.path)
 
-        path = os.path.join(CACHED_FRAMES_DIR, f"{self.id}{seconds}.png")
-        command = f"video_frame_extractor {self.path} {timestamp} {path}"
+        path = os.path.join(
+            CACHED_FRAMES_DIR, f"{self.id}{seconds}.{milliseconds}.png"
+        )
 
-        try:
-            subprocess.call(
-                command, stdout=subprocess.PIPE, shell=True, timeout=EXTRACTION_TIMEOUT
-            )
-        except subprocess.TimeoutExpired as error:
-            raise exceptions.KinoUnwantedException(error) from None
+        if not os.path.isfile(path):
+            command = ["video_frame_extractor", self.path, timestamp, path]
+
+            try:
+                subprocess.call(
+                    command, stdout=subprocess.DEVNULL, timeout=EXTRACTION_TIMEOUT
+                )
+            except subprocess.TimeoutExpired as error:
+                raise exceptions.KinoUnwantedException(error) from None
+        else:
+            logger.debug("Already extracted: %s", path)
 
         if os.path.isfile(path):
             frame = cv2.imread(path)
-            os.remove(path)
             if frame is not None:
                 return frame
 
+            os.remove(path)  # Corrupted file
+
             raise exceptions.InexistentTimestamp(f"`{seconds}` not found")
 
         raise exceptions.InexistentTimestamp(
@@ -1107,18 +1226,34 @@ class Song(ExternalMedia):
             exceptions.MovieNotFound
         """
         query = query.lower().strip()
-        item_list = sql_to_dict(cls.__database__, "select * from songs")
+        item_list = _get_song_dicts("cache")
+
+        # First try to find the song by title (almost always happens)
+        for item in item_list:
+            if query == f"{item['artist']} - {item['title']}".lower():
+                logger.debug("Song found by title: %s", item["title"])
+                return cls(**item, _in_db=True)
 
         # We use loops for year and og_title matching
         initial = 0
         final_list = []
         for item in item_list:
-            fuzzy = fuzz.ratio(query, f"{item['artist']} - {item['title']}".lower())
+            title = f"{item['artist']} - {item['title']}".lower()
+            if not _ratio_is_possible(query, title, 59):
+                continue
+
+            fuzzy = fuzz.ratio(query, title)
 
             if fuzzy > initial:
                 initial = fuzzy
                 final_list.append(item)
 
+                if fuzzy > 98:  # Don't waste more time
+                    break
+
+        if not final_list:
+            raise exceptions.NothingFound
+
         item = final_list[-1]
 
         if initial < 59:
@@ -1315,7 +1450,34 @@ class AlbumCover(ExternalMedia):
         raise exceptions.NothingFound
 
 
+# Populated once at import time to avoid walking __subclasses__ per request
+_EXTERNAL_MEDIA_CLASSES = tuple(ExternalMedia.__subclasses__())
+
+
 # Utils
+def _ratio_is_possible(query: str, title: str, threshold: int) -> bool:
+    """Check if fuzz.ratio could ever reach the threshold given the lengths.
+
+    The ratio is bounded by 2*min(len)/(sum of lens), so wildly different
+    lengths can be discarded with an integer compare instead of running
+    the expensive matcher.
+
+    :param query:
+    :type query: str
+    :param title:
+    :type title: str
+    :param threshold:
+    :type threshold: int
+    :rtype: bool
+    """
+    len_a, len_b = len(query), len(title)
+    return 200 * min(len_a, len_b) >= threshold * (len_a + len_b)
+
+
+_VIDEO_EXTENSIONS = (".mkv", ".mp4", ".avi", ".m4v", ".webm")
+
+
+@region.cache_on_arguments(expiration_time=MEDIA_LIST_TIME)
 def _find_from_subtitle(database: str, table: str, path: str) -> dict:
     """
     :param path:
@@ -1324,12 +1486,24 @@ def _find_from_subtitle(database: str, table: str, path: str) -> dict:
     :raises exceptions.NothingFound
     """
     path = path.replace(".en.srt", "")
+
+    # The stored path is this basename plus a container extension; try
+    # the indexable equality lookup before paying an instr() full scan
+    candidates = tuple(path + ext for ext in _VIDEO_EXTENSIONS)
+    placeholders = ",".join("?" * len(candidates))
     result = sql_to_dict(
         database,
-        f"select * from {table} where instr(path, ?) > 0;",
-        (path,),
+        f"select * from {table} where path in ({placeholders})",
+        candidates,
     )
 
+    if not result:
+        result = sql_to_dict(
+            database,
+            f"select * from {table} where instr(path, ?) > 0;",
+            (path,),
+        )
+
     if result:
         return result[0]
 
@@ -1337,6 +1511,34 @@ def _find_from_subtitle(database: str, table: str, path: str) -> dict:
 
 
 # Cached functions
+@region.cache_on_arguments(expiration_time=MEDIA_LIST_TIME)
+def _parse_subtitles(path: str, mtime: float) -> List[srt.Subtitle]:
+    # Keyed on mtime so edited files re-parse; every hit unpickles a
+    # fresh list, which the brackets are free to mutate
+    assert mtime is not None
+
+    with open(path, "r") as item:
+        return list(srt.parse(item))
+
+
+@region.cache_on_arguments(expiration_time=MEDIA_LIST_TIME)
+def _get_movie_dicts(cache: str) -> List[dict]:
+    assert cache is not None
+    return sql_to_dict(None, "select * from movies where hidden=0")
+
+
+@region.cache_on_arguments(expiration_time=MEDIA_LIST_TIME)
+def _get_tv_show_dicts(cache: str) -> List[dict]:
+    assert cache is not None
+    return sql_to_dict(None, "select * from tv_shows")
+
+
+@region.cache_on_arguments(expiration_time=MEDIA_LIST_TIME)
+def _get_song_dicts(cache: str) -> List[dict]:
+    assert cache is not None
+    return sql_to_dict(None, "select * from songs")
+
+
 @region.cache_on_arguments()
 def _find_fanart(item_id: int, is_tv: bool = False) -> list:
     """Try to find a list of logo dicts from Fanart.
@@ -1351,7 +1553,7 @@ def _find_fanart(item_id: int, is_tv: bool = False) -> list:
 
     logger.debug("Base: %s", base)
     try:
-        r = requests.get(
+        r = _SESSION.get(
             f"{base}/{item_id}", params={"api_key": FANART_KEY}, timeout=10
         )
         r.raise_for_status()
@@ -1392,14 +1594,14 @@ def _get_static_image(url: str):
     return download_image(url, path)
 
 
-@region.cache_on_arguments()
+@region.cache_on_arguments(expiration_time=YT_TITLE_TIME)
 def _get_yt_title(video_id: str):
     params = {
         "id": video_id,
         "part": "snippet",
         "key": YOUTUBE_API_KEY,
     }
-    response = requests.get(YOUTUBE_API_BASE, params=params)
+    response = _SESSION.get(YOUTUBE_API_BASE, params=params)
     video = response.json()
     if not video.get("items"):
         raise exceptions.NothingFound
@@ -1414,23 +1616,24 @@ def _get_yt_title(video_id: str):
 
 @region.cache_on_arguments()
 def _get_met_museum_object(id_) -> dict:
-    response = requests.get(f"{MET_MUSEUM_BASE}/objects/{id_}")
+    response = _SESSION.get(f"{MET_MUSEUM_BASE}/objects/{id_}")
     return response.json()
 
 
+_YT_ID_RE = re.compile(
+    r"(?:v=|youtu\.be/|youtube\.com/embed/|youtube\.com/shorts/)([A-Za-z0-9_-]{11})"
+)
+
+
 def _extract_id_from_url(video_url: str) -> str:
     """
     :param video_url: YouTube URL (classic or mobile)
     """
-    video_url = video_url.strip()
-    parsed = parse.parse_qs(parse.urlparse(video_url).query).get("v")
-    if parsed is not None:
-        return parsed[0]
-
-    # Mobile fallback
-    if "youtu.be" in video_url:
-        parsed = parse.urlsplit(video_url)
-        return parsed.path.replace("/", "")
+    # One regex scan covers every URL form; the old version parsed the
+    # URL twice with urllib
+    match = _YT_ID_RE.search(video_url.strip())
+    if match is not None:
+        return match.group(1)
 
     raise exceptions.InvalidRequest(f"Invalid video URL: {video_url}")
 
@@ -1,11 +1,15 @@
 import logging
 import sqlite3
 from functools import cached_property
-from typing import Generator, List, Optional, Tuple, Union
+from itertools import chain
+from typing import List, Optional, Tuple, Union
 
+import requests
 import tmdbsimple as tmdb
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-from .cache import region
+from .cache import TMDB_META_TIME, region
 from .constants import TMDB_KEY, WEBSITE
 from .db import Kinobase, sql_to_dict
 from .exceptions import NothingFound
@@ -13,6 +17,21 @@ from .utils import clean_url
 
 tmdb.API_KEY = TMDB_KEY
 
+# Shared by every tmdbsimple call in the bot; amortizes the TLS handshake
+# across requests and retries transient server errors
+_tmdb_session = requests.Session()
+_tmdb_session.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=16,
+        max_retries=Retry(
+            total=3, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504)
+        ),
+    ),
+)
+tmdb.REQUESTS_SESSION = _tmdb_session
+
 logger = logging.getLogger(__name__)
 
 
@@ -235,19 +254,21 @@ class Category(Meta):
         return f"<Category {self.name} ({self.id})>"
 
 
-_JOB_ROLES = (
-    "Screenplay",
-    "Screenstory",
-    "Director of Photography",
-    "Director",
-    "Producer",
-    "Sound Designer",
-    "Sound Mixer",
-    "Sound Editor",
-    "Original Music Composer",
-    "Writer",
-    "Editor",
-    "Novel",
+_JOB_ROLES = frozenset(
+    (
+        "Screenplay",
+        "Screenstory",
+        "Director of Photography",
+        "Director",
+        "Producer",
+        "Sound Designer",
+        "Sound Mixer",
+        "Sound Editor",
+        "Original Music Composer",
+        "Writer",
+        "Editor",
+        "Novel",
+    )
 )
 
 
@@ -299,10 +320,10 @@ class Credits(Kinobase):
     def from_tmdb_id(cls, tmdb_id):
         credits_ = _get_tmdb_credits(tmdb_id)
 
-        crew = [credit for credit in credits_["crew"] if credit["job"] in _JOB_ROLES]
+        crew = (credit for credit in credits_["crew"] if credit["job"] in _JOB_ROLES)
 
         people = []
-        for person in credits_["cast"][:7] + crew:
+        for person in chain(credits_["cast"][:7], crew):
             role = person.get("character", person.get("job", "n/a"))
 
             if role is None or "uncredited" in role or not role:  # ""
@@ -332,10 +353,10 @@ class EpisodeCredits(Credits):
 
     @classmethod
     def from_tmdb_dict(cls, credits_: dict):
-        crew = [credit for credit in credits_["crew"] if credit["job"] in _JOB_ROLES]
+        crew = (credit for credit in credits_["crew"] if credit["job"] in _JOB_ROLES)
 
         people = []
-        for person in credits_["guest_stars"][:5] + crew:
+        for person in chain(credits_["guest_stars"][:5], crew):
             role = person.get("character", person.get("job", "n/a"))
 
             if role is None or "uncredited" in role or not role:  # ""
@@ -439,14 +460,17 @@ class MovieMetadata(Metadata):
         genres = self._get_foreign("categories", "categories", "category")
         return [Category(**item) for item in genres]
 
-    @property
-    def embed_fields(self) -> Generator[dict, None, None]:
-        for meta in (self.genres, self.countries, self.categories):  # type: ignore
-            if meta:
-                yield {
-                    "name": meta[0].table.title(),
-                    "value": ", ".join([item.markdown_url for item in meta]),
-                }
+    @cached_property
+    def embed_fields(self) -> Tuple[dict, ...]:
+        # Materialized so repeated embed builds don't redo the markdown joins
+        return tuple(
+            {
+                "name": meta[0].table.title(),
+                "value": ", ".join(item.markdown_url for item in meta),
+            }
+            for meta in (self.genres, self.countries, self.categories)  # type: ignore
+            if meta
+        )
 
     @property
     def request_title(self) -> str:
@@ -466,7 +490,21 @@ class MovieMetadata(Metadata):
         self._load_movie_info_from_tmdb()
 
         logger.info("Registering metadata in the database")
-        for item in self._genres + self._countries + self._categories:  # type: ignore
+        for items in (self._genres, self._countries):
+            if not items:
+                continue
+
+            self._execute_many(
+                f"insert or ignore into {items[0].table} (id,name,image) values (?,?,?)",
+                [(item.id, item.name, item.image) for item in items],
+            )
+            self._execute_many(
+                f"insert or ignore into {items[0].item_table} "
+                f"(movie_id,{items[0].prefix}_id) values (?,?)",
+                [(self.id, item.id) for item in items],
+            )
+
+        for item in self._categories:  # type: ignore
             item.register(self.id)
 
         self._credits = Credits.from_tmdb_id(self.id)
@@ -515,13 +553,17 @@ class EpisodeMetadata(Metadata):
         self._credits.register()
 
 
-@region.cache_on_arguments()
-def _get_tmdb_credits(movie_id: int) -> dict:
+@region.cache_on_arguments(expiration_time=TMDB_META_TIME)
+def _get_tmdb_movie_with_credits(movie_id: int) -> dict:
     movie = tmdb.Movies(movie_id)
-    return movie.credits()
+    return movie.info(append_to_response="credits")
+
+
+def _get_tmdb_credits(movie_id: int) -> dict:
+    return _get_tmdb_movie_with_credits(movie_id)["credits"]
 
 
-@region.cache_on_arguments()
 def get_tmdb_movie(movie_id: int) -> dict:
-    movie = tmdb.Movies(movie_id)
-    return movie.info()
+    movie = dict(_get_tmdb_movie_with_credits(movie_id))
+    movie.pop("credits", None)
+    return movie
@@ -16,6 +16,7 @@ from .constants import (
     WEBSITE,
 )
 from .db import Kinobase
+from .exceptions import RecentPostFound
 from .media import Movie
 from .post import Post
 from .request import Request
@@ -39,6 +40,11 @@ class FBPoster(Kinobase):
 
     def handle(self):
         "Post, register metadata, notify and comment."
+        # A recent post aborts the cycle anyway; check it before paying
+        # for the whole frame pipeline
+        if self.post.published and self.post.recently_posted():
+            raise RecentPostFound
+
         assert self.handler.get()
 
         self.request.mark_as_used()
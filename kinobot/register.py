@@ -3,18 +3,21 @@
 # License: GPL
 # Author : Vitiko <vhnz98@gmail.com>
 
-import json
+import itertools
 import logging
 import os
 import sqlite3
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional
 
 import requests
 import tmdbsimple as tmdb
-from facepy import GraphAPI
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-from kinobot.cache import MEDIA_LIST_TIME, region
+from kinobot.cache import MEDIA_LIST_TIME, TMDB_META_TIME, region
 from kinobot.media import Episode, Movie, TVShow
 
 from .constants import (
@@ -35,13 +38,72 @@ from .constants import (
 )
 from .db import Kinobase
 from .exceptions import InvalidRequest, KinoException, SubtitlesNotFound, NothingFound
-from .post import Post
+from .post import Post, get_graph_api
 from .request import Request
 from .user import User
-from .utils import send_webhook
+from .utils import send_webhook, send_webhook_embeds
 
 tmdb.API_KEY = TMDB_KEY
 
+# Radarr and Sonarr answer dozens of calls per scan; one pooled session
+# keeps their connections alive instead of paying a handshake per call
+_adapter = HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=20,
+    max_retries=Retry(
+        total=3, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504)
+    ),
+)
+_SESSION = requests.Session()
+_SESSION.headers.update({"User-Agent": "kinobot/1.0"})
+_SESSION.mount("http://", _adapter)  # The *arrs usually sit on plain http
+_SESSION.mount("https://", _adapter)
+
+# The *arrs send ETags; revalidating turns the common unchanged-library
+# case into a bodyless 304 instead of a multi-megabyte re-download
+_etags: dict = {}
+_etags_lock = threading.Lock()
+
+
+def _get_json(url: str, params: Optional[dict] = None, headers: Optional[dict] = None):
+    """GET a JSON document, revalidating with ETags when possible.
+
+    Callers must not mutate the returned document: a 304 serves the same
+    object again.
+
+    :param url:
+    :type url: str
+    :param params:
+    :type params: Optional[dict]
+    :param headers:
+    :type headers: Optional[dict]
+    """
+    headers = dict(headers or {})
+    key = (url, tuple(sorted((params or {}).items())))
+
+    with _etags_lock:
+        cached = _etags.get(key)
+
+    if cached is not None:
+        headers["If-None-Match"] = cached[0]
+
+    response = _SESSION.get(url, params=params, headers=headers)
+
+    if cached is not None and response.status_code == 304:
+        logger.debug("Revalidated: %s", url)
+        return cached[1]
+
+    response.raise_for_status()
+    data = response.json()
+
+    etag = response.headers.get("ETag")
+    if etag is not None:
+        with _etags_lock:
+            _etags[key] = (etag, data)
+
+    return data
+
+
 logger = logging.getLogger(__name__)
 
 _FB_REQ_TYPES = (
@@ -51,6 +113,8 @@ _FB_REQ_TYPES = (
     "!swap",
 )
 
+_FB_REQ_TYPES_SET = frozenset(_FB_REQ_TYPES)
+
 
 _token_map = {
     "en": FACEBOOK_TOKEN,
@@ -75,7 +139,7 @@ class FacebookRegister(Kinobase):
 
         logger.debug("Identifier: %s", self.identifier)
 
-        self._api = GraphAPI(self.page_token)
+        self._api = get_graph_api(self.page_token)
         self._comments: List[dict] = []
         self._posts: List[Post] = []
         self.__collected = False
@@ -91,7 +155,15 @@ class FacebookRegister(Kinobase):
         "Register ratings."
         logger.info("Registering ratings")
         self._collect()
-        for comment in self._comments:
+
+        # Most comments are not ratings; filter them out in one pass
+        rate_comments = [
+            comment
+            for comment in self._comments
+            if (comment.get("message") or "").lstrip().startswith("!rate")
+        ]
+
+        for comment in rate_comments:
             try:
                 self._rate_movie(comment)
             except KinoException as error:
@@ -108,10 +180,24 @@ class FacebookRegister(Kinobase):
 
         logger.info("About to scan %d posts", self.page_limit)
 
-        for post in kinobot.get("me/posts", limit=self.page_limit).get("data", []):  # type: ignore
-            comments = kinobot.get(str(post.get("id")) + "/comments")
-            for comment in comments.get("data", []):  # type: ignore
-                self._comments.append(comment)
+        # Field expansion returns the posts and their comments in one
+        # round trip instead of an extra GET per post
+        posts = kinobot.get(
+            "me/posts",
+            limit=self.page_limit,
+            fields="id,comments.limit(100){message,from,id}",
+        )
+
+        for post in posts.get("data", []):  # type: ignore
+            comments = post.get("comments", {})
+            self._comments.extend(comments.get("data", []))
+
+            # Only posts with more than 100 comments pay for extra pages
+            next_ = comments.get("paging", {}).get("next")
+            while next_ is not None:
+                page = _SESSION.get(next_).json()
+                self._comments.extend(page.get("data", []))
+                next_ = page.get("paging", {}).get("next")
 
         self.__collected = True
 
@@ -167,16 +253,20 @@ class FacebookRegister(Kinobase):
     def _register_request(self, comment: dict):
         msg = comment.get("message", "n/a")
 
-        for type_ in _FB_REQ_TYPES:
+        # One C-level prefix scan rejects the vast majority of comments
+        # before paying for the split
+        if not msg.startswith(_FB_REQ_TYPES):
+            return
 
-            if not msg.startswith(type_):
-                continue
+        type_ = msg.split(maxsplit=1)[0]
 
-            request = Request.from_fb(comment, self.identifier)
-            request.type = type_  # Workaround
+        if type_ not in _FB_REQ_TYPES_SET:  # e.g. "!reqs ..."
+            return
+
+        request = Request.from_fb(comment, self.identifier)
+        request.type = type_  # Workaround
 
-            request.register()
-            break
+        request.register()
 
     @staticmethod
     def _rate_movie(comment: dict):
@@ -188,22 +278,40 @@ class FacebookRegister(Kinobase):
             exceptions.MovieNotFound
         """
         msg = comment.get("message", "n/a").strip()
-        if msg.startswith("!rate"):
-            clean = msg.replace("!rate", "").strip().split()  # ["xx", "rate"]
+        clean = msg.replace("!rate", "").strip().split()  # ["xx", "rate"]
 
-            rating = clean[-1].split("/")[0]
+        rating = clean[-1].split("/")[0]
+
+        try:
+            rating = float(rating)
+        except ValueError:
+            raise InvalidRequest(f"Invalid rating: {rating}") from None
+
+        user = User.from_fb(**comment.get("from", {}))
+        user.register()
+
+        movie = Movie.from_query(" ".join(clean))
+
+        user.rate_media(movie, rating)
 
-            try:
-                rating = float(rating)
-            except ValueError:
-                raise InvalidRequest(f"Invalid rating: {rating}") from None
 
-            user = User.from_fb(**comment.get("from", {}))
-            user.register()
+class _ExternalItem:
+    """Lightweight view of an external item for catalog diffs.
 
-            movie = Movie.from_query(" ".join(clean))
+    Building the full Movie/Episode (credits parsing included) for
+    thousands of already-registered items was wasted work; the diff only
+    needs the id and the path.
+    """
 
-            user.rate_media(movie, rating)
+    __slots__ = ("id", "path", "raw")
+
+    def __init__(self, id_, path: str, raw: dict):
+        self.id = str(id_)  # Normalized once; the diff compares ids as str
+        self.path = path
+        self.raw = raw
+
+    def __repr__(self) -> str:
+        return f"<ExternalItem {self.id} ({self.path})>"
 
 
 class MediaRegister(Kinobase):
@@ -221,27 +329,30 @@ class MediaRegister(Kinobase):
         self._load_local()
         self._load_external()
 
+        # Indexed lookups instead of a full scan per item; every id is
+        # stringified exactly once
+        local_by_id = {str(item.id): item for item in self.local_items}
+        external_by_id = {item.id: item for item in self.external_items}
+        external_paths = {item.path for item in self.external_items}
+
         for external in self.external_items:
-            if not any(str(item.id) == str(external.id) for item in self.local_items):
+            if external.id not in local_by_id:
                 logger.info("Appending missing item: %s", external)
                 self.new_items.append(external)
 
-        for local in self.local_items:
-            if not any(str(item.id) == str(local.id) for item in self.external_items):
+        for id_, local in local_by_id.items():
+            if id_ not in external_by_id:
                 logger.info("Appending deleted item: %s", local)
                 self.deleted_items.append(local)
 
         # Modified paths
-        for local in self.local_items:
-            if not any(item.path == local.path for item in self.external_items):
-                try:
-                    local.path = next(
-                        item.path
-                        for item in self.external_items
-                        if str(local.id) == str(item.id)
-                    )
-                except StopIteration:
+        for id_, local in local_by_id.items():
+            if local.path not in external_paths:
+                external = external_by_id.get(id_)
+                if external is None:
                     continue
+
+                local.path = external.path
                 logger.info("Appending item with new path: %s", local.path)
                 self.modified_items.append(local)
 
@@ -254,7 +365,9 @@ class MediaRegister(Kinobase):
         if not self.new_items:
             logger.info("No new items to add")
         else:
-            for new in self.new_items:
+            added = []
+            for ref in self.new_items:
+                new = self._resolve_external(ref)
                 try:
                     assert new.subtitle
                 except FileNotFoundError:
@@ -266,12 +379,34 @@ class MediaRegister(Kinobase):
                     #    logger.debug("Item %s has no subtitles", new)
                     #    continue
                 new.load_meta()
-                new.register()
-                if self.type == "movies":
-                    send_webhook(DISCORD_ANNOUNCER_WEBHOOK, new.webhook_embed)
+                added.append(new)
 
-            if self.type == "episodes":
-                self._mini_notify(self.new_items, "added")
+            if not added:
+                return
+
+            # One transaction (one fsync) for all the new rows instead of
+            # an insert-commit per item
+            try:
+                self._execute_many(
+                    added[0]._get_insert_command(),
+                    [item._get_sqlite_tuple() for item in added],
+                )
+            except sqlite3.IntegrityError:
+                # A duplicate row (e.g. a hidden item resurfacing) rolls
+                # the batch back; re-register one by one so the conflicting
+                # items get updated and the rest still land
+                logger.info("Duplicate row in batch. Registering per item")
+                for item in added:
+                    item.register()
+
+            if self.type == "movies":
+                # Ten embeds fit in one webhook call; don't pay a POST
+                # per added movie
+                send_webhook_embeds(
+                    DISCORD_ANNOUNCER_WEBHOOK, [new.webhook_embed for new in added]
+                )
+            else:
+                self._mini_notify(added, "added")
 
     def _handle_deleted(self):
         if not self.deleted_items:
@@ -279,7 +414,13 @@ class MediaRegister(Kinobase):
         else:
             for deleted in self.deleted_items:
                 deleted.hidden = True
-                deleted.update()
+
+            # One statement in one transaction instead of a full-column
+            # update per item
+            self._execute_many(
+                f"update {self.type} set hidden=1 where id=?",
+                [(item.id,) for item in self.deleted_items],
+            )
 
             self._mini_notify(self.deleted_items, "deleted")
 
@@ -287,8 +428,20 @@ class MediaRegister(Kinobase):
         if not self.modified_items:
             logger.info("No items to modify")
         else:
-            for item in self.modified_items:
-                item.update()
+            # One statement in one transaction instead of an update-commit
+            # per item
+            first = self.modified_items[0]
+            command = (
+                f"update {first.table} set "
+                f"{'=?, '.join(first.__insertables__)}=? where id=?"
+            )
+            self._execute_many(
+                command,
+                [
+                    item._get_sqlite_tuple() + (item.id,)
+                    for item in self.modified_items
+                ],
+            )
 
             self._mini_notify(self.modified_items, "updated")
 
@@ -301,7 +454,7 @@ class MediaRegister(Kinobase):
             except:
                 titles.append(i.title)
 
-        strs = ", ".join(list(dict.fromkeys([f"**{item}**" for item in titles])))
+        strs = ", ".join(dict.fromkeys(f"**{item}**" for item in titles))
         msg = f"The following items were **{action}**: {strs}"
         send_webhook(DISCORD_ANNOUNCER_WEBHOOK, msg)
 
@@ -313,88 +466,97 @@ class MediaRegister(Kinobase):
 
     def _load_external(self):
         self.external_items = [
-            Movie.from_radarr(item) for item in _get_radarr_list("cache")
+            _ExternalItem(item["tmdbId"], item["movieFile"]["path"], item)
+            for item in _get_radarr_list("cache")
         ]
         logger.debug("Loaded external items: %s", len(self.external_items))
 
+    @staticmethod
+    def _resolve_external(ref: _ExternalItem) -> Movie:
+        return Movie.from_radarr(ref.raw)
+
 
 class EpisodeRegister(MediaRegister):
     type = "episodes"
 
     def _load_external(self):
         self.external_items = [
-            Episode.from_register_dict(item) for item in _get_episodes("cache")
+            _ExternalItem(item["id"], item["path"], item)
+            for item in _get_episodes("cache")
         ]
 
+    @staticmethod
+    def _resolve_external(ref: _ExternalItem) -> Episode:
+        return Episode.from_register_dict(ref.raw)
+
 
 def _get_episodes(cache_str: str) -> List[dict]:
     assert cache_str is not None
 
-    session = requests.Session()
+    series_list = _get_json(
+        f"{SONARR_URL}/api/series", headers={"X-Api-Key": SONARR_TOKEN}
+    )
 
-    response = session.get(f"{SONARR_URL}/api/series?apiKey={SONARR_TOKEN}")
+    series = [serie for serie in series_list if serie.get("sizeOnDisk", 0)]
 
-    response.raise_for_status()
+    # Every series takes a handful of independent Sonarr and TMDB calls;
+    # overlap their network latency
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = executor.map(_process_series, series)
 
-    series = response.json()
+    return list(itertools.chain.from_iterable(results))
 
-    episode_list = []
-    for serie in series:
-        if not serie.get("sizeOnDisk", 0):
-            continue
 
-        found_ = _get_tmdb_imdb_find(serie["imdbId"])
+def _process_series(serie: dict) -> List[dict]:
+    found_ = _get_tmdb_imdb_find(serie["imdbId"])
 
-        tmdb_serie = _get_tmdb_tv_show(found_[0]["id"])
+    tmdb_serie = _get_tmdb_tv_show(found_[0]["id"])
 
-        tv_show = TVShow(imdb=serie["imdbId"], tvdb=serie["tvdbId"], **tmdb_serie)
-        tv_show.register()
+    tv_show = TVShow(imdb=serie["imdbId"], tvdb=serie["tvdbId"], **tmdb_serie)
+    tv_show.register()
 
-        tv_show_id = tmdb_serie["id"]
+    tv_show_id = tmdb_serie["id"]
 
-        episodes_r = session.get(
-            f"{SONARR_URL}/api/episode",
-            params={"apiKey": SONARR_TOKEN, "seriesId": serie.get("id")},
-        )
+    episodes_list = _get_json(
+        f"{SONARR_URL}/api/episode",
+        params={"seriesId": serie.get("id")},
+        headers={"X-Api-Key": SONARR_TOKEN},
+    )
 
-        episodes_r.raise_for_status()
+    episodes = [item for item in episodes_list if item["hasFile"]]
 
-        episodes = [item for item in episodes_r.json() if item["hasFile"]]
+    season_ns = [
+        season["seasonNumber"]
+        for season in serie["seasons"]
+        if season["statistics"]["sizeOnDisk"]
+    ]
 
-        season_ns = [
-            season["seasonNumber"]
-            for season in serie["seasons"]
-            if season["statistics"]["sizeOnDisk"]
-        ]
+    try:
+        return list(_gen_episodes(season_ns, tv_show_id, episodes))
+    except requests.exceptions.HTTPError:
+        logger.debug("Anime fallback for TV Show: %s", tv_show_id)
 
-        try:
-            episode_list += _gen_episodes(season_ns, tv_show_id, episodes)
-        except requests.exceptions.HTTPError:
-            logger.debug("Anime fallback for TV Show: %s", tv_show_id)
-
-            episode_list += _gen_episodes_anime_fallback(tv_show_id, episodes)
-
-    return episode_list
+        return list(_gen_episodes_anime_fallback(tv_show_id, episodes))
 
 
 def _gen_episodes(season_ns: List[int], tmdb_id: int, radarr_eps: List[dict]):
+    # One index build instead of a Sonarr list scan per episode
+    path_by_se = {
+        (item["seasonNumber"], item["episodeNumber"]): item["episodeFile"]["path"]
+        for item in radarr_eps
+    }
+
     for season in season_ns:
         tmdb_season = _get_tmdb_season(tmdb_id, season)
 
         for episode in tmdb_season["episodes"]:
-            try:
-                episode["path"] = next(
-                    _replace_path(
-                        item["episodeFile"]["path"], TV_SHOWS_DIR, SONARR_ROOT_DIR
-                    )
-                    for item in radarr_eps
-                    if item["episodeNumber"] == episode["episode_number"]
-                    and season == item["seasonNumber"]
-                )
-                episode["tv_show_id"] = tmdb_id
-                yield episode
-            except StopIteration:
-                pass
+            path = path_by_se.get((season, episode["episode_number"]))
+            if path is None:
+                continue
+
+            episode["path"] = _replace_path(path, TV_SHOWS_DIR, SONARR_ROOT_DIR)
+            episode["tv_show_id"] = tmdb_id
+            yield episode
 
 
 def _gen_episodes_anime_fallback(tmdb_id: int, radarr_eps: List[dict]):
@@ -416,40 +578,43 @@ def _gen_episodes_anime_fallback(tmdb_id: int, radarr_eps: List[dict]):
             yield episode
 
 
+@region.cache_on_arguments(expiration_time=MEDIA_LIST_TIME)
 def _get_radarr_list(cache_str: str) -> List[dict]:
     assert cache_str is not None
 
-    response = requests.get(f"{RADARR_URL}/api/v3/movie?apiKey={RADARR_TOKEN}")
-
-    response.raise_for_status()
+    movies = _get_json(f"{RADARR_URL}/api/v3/movie", headers={"X-Api-Key": RADARR_TOKEN})
 
     items = []
-    for i in json.loads(response.content):
+    for i in movies:
         if not i.get("hasFile"):
             continue
 
-        i["movieFile"]["path"] = _replace_path(
-            i["movieFile"]["path"], MOVIES_DIR, RADARR_ROOT_DIR
+        # Copied instead of mutated: a 304 revalidation serves the same
+        # dicts again
+        i = dict(i)
+        i["movieFile"] = dict(
+            i["movieFile"],
+            path=_replace_path(i["movieFile"]["path"], MOVIES_DIR, RADARR_ROOT_DIR),
         )
         items.append(i)
 
     return items
 
 
-@region.cache_on_arguments()
+@region.cache_on_arguments(expiration_time=TMDB_META_TIME)
 def _get_tmdb_imdb_find(imdb_id):
     find_ = tmdb.find.Find(id=imdb_id)
     results = find_.info(external_source="imdb_id")["tv_results"]
     return results
 
 
-@region.cache_on_arguments()
+@region.cache_on_arguments(expiration_time=TMDB_META_TIME)
 def _get_tmdb_tv_show(show_id) -> dict:
     tmdb_show = tmdb.TV(show_id)
     return tmdb_show.info()
 
 
-@region.cache_on_arguments()
+@region.cache_on_arguments(expiration_time=TMDB_META_TIME)
 def _get_tmdb_season(serie_id, season_number) -> dict:
     tmdb_season = tmdb.TV_Seasons(serie_id, season_number)
     return tmdb_season.info()
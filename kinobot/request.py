@@ -6,8 +6,9 @@
 import datetime
 import logging
 import re
+import secrets
+import sqlite3
 
-from random import randint
 from typing import List, Optional, Sequence, Tuple, Union
 
 import timeago
@@ -114,7 +115,7 @@ class Request(Kinobase):
 
         self.comment = comment.strip()
         self.args = {}
-        self.id = id or str(randint(100000, 200000))
+        self.id = id or secrets.token_hex(5)
 
         if type is None and self.comment.startswith("!"):
             type = self.comment.split(" ")[0].strip()
@@ -171,10 +172,18 @@ class Request(Kinobase):
         return self.user.id
 
     def register(self):
-        "Register the request and the user if needed."
+        "Register the request and the user (if needed) in one transaction."
         if not self._in_db:
-            self.user.register()
-            self._insert()
+            with sqlite3.connect(self.__database__) as conn:
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.set_trace_callback(logger.debug)
+                conn.execute(
+                    "insert or ignore into users (id, name, role) values (?,?,?)",
+                    (self.user.id, self.user.name, ",".join(self.user.roles)),
+                )
+                conn.execute(self._get_insert_command(), self._get_sqlite_tuple())
+
+            self.user._registered = True
             self._in_db = True
 
     def register_verifications(self, user_ids, verified: bool, reason=None):
@@ -13,9 +13,13 @@ from typing import Generator, List, Union
 
 import tmdbsimple as tmdb
 from discord import Embed
-from fuzzywuzzy import fuzz
 from ripgrepy import Ripgrepy
 
+try:
+    from rapidfuzz import fuzz  # C++-backed drop-in for ratio
+except ImportError:
+    from fuzzywuzzy import fuzz
+
 import kinobot.exceptions as exceptions
 
 from .constants import SUBS_DIR, TMDB_KEY
@@ -28,6 +32,8 @@ from .utils import is_episode
 
 tmdb.API_KEY = TMDB_KEY
 
+_NON_WORD_RE = re.compile(r"\W")
+
 logger = logging.getLogger(__name__)
 
 
@@ -37,7 +43,7 @@ class MovieSearch(Kinobase):
         self.limit = limit
         self.items: List[Movie] = []
 
-    @property
+    @cached_property
     def embed(self) -> Embed:
         embed = Embed(title=f"Query: `{self.query}`")
 
@@ -51,11 +57,11 @@ class MovieSearch(Kinobase):
 
         final_list = []
         for item in item_list:
-            media_ = Movie(**item)
-            title_ = media_.simple_title.lower()
+            title_ = f"{item['title']} ({item['year']})".lower()
             score = fuzz.ratio(self.query, title_)
 
             if score > 58:
+                item["score"] = score
                 final_list.append(item)
 
         self.items.extend(
@@ -79,7 +85,7 @@ class MediaFuzzySearch(Kinobase):
         self.limit = limit
         self.items: List[Union[Movie, TVShow]] = []
 
-    @property
+    @cached_property
     def embed(self) -> Embed:
         embed = Embed(title=f"Query: `{self.query}`")
 
@@ -136,7 +142,7 @@ class QuoteSearch:
         self.media_items: List[Union[Movie, Episode]] = []
         self.items: List[dict] = []
 
-    @property
+    @cached_property
     def embed(self) -> Embed:
         embed = Embed(title=f"Query: `{self.query}` (--filter `{self.filter_}`)")
 
@@ -200,7 +206,7 @@ class QuoteSearch:
         after_word = r"(\s|\W|$|(\W\s))"
         pattern = r"(^|\s|\W)"
         for word in self.query.split():
-            word = re.sub(r"\W", "", word)
+            word = _NON_WORD_RE.sub("", word)
             pattern = pattern + word + after_word
 
         logger.debug("Generated pattern: %s", pattern)
@@ -238,7 +244,7 @@ class PersonSearch(Kinobase):
         self.type_ = type_.title()
         self.items: List[Person] = []
 
-    @property
+    @cached_property
     def embeds(self) -> List[Embed]:
         embeds = []
 
@@ -331,7 +337,7 @@ class RequestSearch(Kinobase):
         self.limit = limit
         self.items: List[Request] = []
 
-    @property
+    @cached_property
     def embed(self) -> Embed:
         embed = Embed(title=f"Requests that contain `{self.query}`:")
         for req in self.items:
@@ -360,7 +366,7 @@ class SongSearch(Kinobase):
         self.limit = limit
         self.items: List[Song] = []
 
-    @property
+    @cached_property
     def embed(self) -> Embed:
         embed = Embed(title=f"Songs that contain `{self.query}`:")
         for song in self.items:
@@ -389,7 +395,7 @@ class PostSearch(Kinobase):
         self.limit = limit
         self.items: List[Post] = []
 
-    @property
+    @cached_property
     def embed(self) -> Embed:
         embed = Embed(title=f"Posts that contain `{self.query}`:")
         for req in self.items:
@@ -117,7 +117,7 @@ class Story:
 
         split_quote = quote.split("\n")
 
-        tmp_text = "\n".join(list(_homogenize_lines(split_quote)))
+        tmp_text = "\n".join(_homogenize_lines(split_quote))
 
         split_len = len(split_quote)
         draw = ImageDraw.Draw(self._background)
@@ -72,12 +72,18 @@ class TopMovies(Kinobase):
         :type item_id: int
         :rtype: Optional[int]
         """
-        item_id = str(item_id)
-        for item in self._get_sorted("cached"):
-            if item["id"] == item_id:
-                return item["position"]
+        return self._get_positions("cached").get(str(item_id))
+
+    @region.cache_on_arguments(expiration_time=TOP_TIME)
+    def _get_positions(self, cache: str) -> dict:
+        """Map movie IDs to their top positions for O(1) lookups.
 
-        return None
+        :param cache:
+        :type cache: str
+        :rtype: dict
+        """
+        assert cache is not None
+        return {str(item["id"]): item["position"] for item in self._get_sorted("cached")}
 
     @region.cache_on_arguments(expiration_time=TOP_TIME)
     def _get_sorted(self, cache: str) -> List[dict]:
@@ -94,14 +100,16 @@ class TopMovies(Kinobase):
             "rated_movie=movies.id group by rated_movie"
         )
         items = self._db_command_to_dict(sql)
-        mean_avg = np.mean([item["avg"] for item in items])
-
-        for item in items:
-            average, votes = item["avg"], item["count"]
-            result = (votes / (votes + self.minimum_votes)) * average + (
-                self.minimum_votes / (votes + self.minimum_votes)
-            ) * mean_avg
-            item["weighted_rating"] = float(result)
+
+        averages = np.array([item["avg"] for item in items])
+        votes = np.array([item["count"] for item in items], dtype=np.float64)
+        mean_avg = averages.mean()
+
+        weights = votes / (votes + self.minimum_votes)
+        ratings = weights * averages + (1 - weights) * mean_avg
+
+        for item, rating in zip(items, ratings):
+            item["weighted_rating"] = float(rating)
 
         logger.info("Sorting %d items", len(items))
 
@@ -25,10 +25,28 @@ from .exceptions import InvalidRequest, LimitExceeded, NothingFound
 logger = logging.getLogger(__name__)
 
 _REQ_DICT = {
-    "gif": ["auteur", "botmin"],
-    "regular": ["director", "auteur", "botmin"],
+    "gif": frozenset(("auteur", "botmin")),
+    "regular": frozenset(("director", "auteur", "botmin")),
 }
 
+_STATS_COLUMNS = (
+    "shares",
+    "comments",
+    "impressions",
+    "other_clicks",
+    "photo_view",
+    "engaged_users",
+    "haha",
+    "like",
+    "love",
+    "sad",
+    "angry",
+    "wow",
+    "care",
+)
+
+_STATS_COLUMNS_SET = frozenset(_STATS_COLUMNS)
+
 _RATING_DICT = {
     0.5: '"Peak Cringe"',
     1.0: '"Peak Cringe"',
@@ -64,7 +82,7 @@ class User(Kinobase):
 
     @classmethod
     def from_discord(cls, ctx_author):
-        role = ",".join([str(role.name) for role in ctx_author.roles])
+        role = ",".join(str(role.name) for role in ctx_author.roles)
         return cls(name=ctx_author.display_name, id=ctx_author.id, role=role)
 
     @classmethod
@@ -146,23 +164,8 @@ class User(Kinobase):
         return results
 
     def posts_stats_count(self, column: str):
-        columns = (
-            "shares",
-            "comments",
-            "impressions",
-            "other_clicks",
-            "photo_view",
-            "engaged_users",
-            "haha",
-            "like",
-            "love",
-            "sad",
-            "angry",
-            "wow",
-            "care",
-        )
-        if column not in columns:
-            raise InvalidRequest(f"Choose between: {', '.join(columns)}")
+        if column not in _STATS_COLUMNS_SET:
+            raise InvalidRequest(f"Choose between: {', '.join(_STATS_COLUMNS)}")
 
         result = self._sql_to_dict(
             f"select sum(posts.{column}) as stats_count from posts "
@@ -183,39 +186,26 @@ class User(Kinobase):
             raise InvalidRequest("Invalid rating: choose between 0.5 to 5")
 
         table = media.type + "_ratings"
-        try:
-            self._execute_sql(
-                f"insert into {table} (rated_{media.type}, rated_by, rating) values (?,?,?)",
-                (
-                    media.id,
-                    self.id,
-                    rating,
-                ),
-            )
-        except sqlite3.IntegrityError:
-            self._execute_sql(
-                f"update {table} set rating=? where rated_by=? and "
-                f"rated_{media.type}=?",
-                (
-                    rating,
-                    self.id,
-                    media.id,
-                ),
-            )
+        self._execute_sql(
+            f"insert into {table} (rated_{media.type}, rated_by, rating) values (?,?,?) "
+            f"on conflict (rated_{media.type}, rated_by) do update set "
+            "rating=excluded.rating",
+            (
+                media.id,
+                self.id,
+                rating,
+            ),
+        )
 
     def register(self):
-        try:
-            self._execute_sql(
-                "insert into users (id, name, role) values (?,?,?)",
-                (
-                    self.id,
-                    self.name,
-                    ",".join(self.roles),
-                ),
-            )
-        except sqlite3.IntegrityError:
-            logger.info("Already registered")
-
+        self._execute_sql(
+            "insert or ignore into users (id, name, role) values (?,?,?)",
+            (
+                self.id,
+                self.name,
+                ",".join(self.roles),
+            ),
+        )
         self._registered = True
 
     def load(self, register: bool = True):
@@ -256,13 +246,12 @@ class User(Kinobase):
         """
         key_roles = _REQ_DICT[request_key]
         logger.info("User roles -> key roles: %s -> %s", self.roles, key_roles)
-        matches = sum([role in key_roles for role in self.roles])
 
-        if matches:
+        if any(role in key_roles for role in self.roles):
             logger.debug("User has unlimited requests for %s requests", request_key)
             self._remain = -1
         else:
-            logger.info("Matches found: %s", matches)
+            logger.info("No matching roles found")
             self._handle_role_limit(7 if request_key != "gif" else 1)
 
     @property
@@ -275,14 +264,11 @@ class User(Kinobase):
     def _handle_role_limit(self, limit: int = 7):
         with sqlite3.connect(self.__database__) as conn:
             conn.set_trace_callback(logger.debug)
-            try:
-                conn.execute(
-                    "insert into role_limits (user_id) values (?)",
-                    (self.id,),
-                )
-                conn.commit()
-            except sqlite3.IntegrityError:
-                pass
+            conn.execute(
+                "insert or ignore into role_limits (user_id) values (?)",
+                (self.id,),
+            )
+            conn.commit()
 
             hits = conn.execute(
                 "select hits from role_limits where user_id=? and hits <= ?",
@@ -446,9 +432,10 @@ def get_top_position(db, user_id, column, from_=None, to_=None, min_posts=None):
 
     top = get_top(db, column, from_=from_, to_=to_, min_posts=min_posts, limit=-1) or []
     top_len = len(top)
-    try:
-        position = [user for user in top if user["user_id"] == user_id][0]
-        position["top_len"] = top_len
-        return position
-    except IndexError:
+
+    position = next((user for user in top if user["user_id"] == user_id), None)
+    if position is None:
         return None
+
+    position["top_len"] = top_len
+    return position
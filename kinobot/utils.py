@@ -35,14 +35,17 @@ from .constants import (
 )
 from .exceptions import EpisodeNotFound, ImageNotFound, InvalidRequest
 
-_IS_EPISODE = re.compile(r"s[0-9][0-9]e[0-9][0-9]")
+_IS_EPISODE = re.compile(r"s[0-9][0-9]e[0-9][0-9]", flags=re.IGNORECASE)
 
-_EPISODE_RE = re.compile(r"(?:s|season)(\d{1,2})(?:e|x|episode|\n)(\d{1,2})")
+_EPISODE_RE = re.compile(
+    r"(?:s|season)(\d{1,2})(?:e|x|episode|\n)(\d{1,2})", flags=re.IGNORECASE
+)
 
 _LOG_FMT = "%(asctime)s - %(module)s.%(levelname)s: %(message)s"
 
 _NON_ALPHA = re.compile(r"([^\s\w]|_|/)+")
 _SPACES = re.compile(r"\s+")
+_EXTRA_SPACES = re.compile(" +")
 
 _ARGS_RE = re.compile(r"(---?[\w-]+)(.*?)(?= --|$)")
 
@@ -232,11 +235,11 @@ def is_episode(title: str) -> bool:
     >>> is_episode(title)
     >>> True
     """
-    return _IS_EPISODE.search(title.lower()) is not None
+    return _IS_EPISODE.search(title) is not None
 
 
 def get_episode_tuple(title: str) -> Tuple[int, int]:
-    matches = _EPISODE_RE.findall(title.replace(" ", "").lower())
+    matches = _EPISODE_RE.findall(title.replace(" ", ""))
     if matches:
         matches = matches[0]
         if len(matches) == 2:
@@ -269,7 +272,9 @@ def send_webhook(
 
     images = images or []
     profile = random.choice(WEBHOOK_PROFILES)
-    webhook = DiscordWebhook(url, **profile)
+    # Sleep and retry on 429s (honors Discord's Retry-After header)
+    # instead of silently dropping the message under bursty activity
+    webhook = DiscordWebhook(url, rate_limit_retry=True, **profile)
 
     if isinstance(content, str):
         webhook.set_content(content[:1900])
@@ -285,6 +290,33 @@ def send_webhook(
     return None
 
 
+def send_webhook_embeds(url: str, embeds: List[DiscordEmbed]):
+    """Send a list of embeds, batching up to ten per webhook call.
+
+    Discord accepts ten embeds per message, so a batch costs one POST
+    instead of a round trip per embed.
+
+    :param url:
+    :type url: str
+    :param embeds:
+    :type embeds: List[DiscordEmbed]
+    """
+    if TEST is True:
+        logger.debug("Testing mode. Not sending %d embeds", len(embeds))
+        return None
+
+    for index in range(0, len(embeds), 10):
+        profile = random.choice(WEBHOOK_PROFILES)
+        webhook = DiscordWebhook(url, rate_limit_retry=True, **profile)
+
+        for embed in embeds[index : index + 10]:
+            webhook.add_embed(embed)
+
+        webhook.execute()
+
+    return None
+
+
 def fmt_exception(error: Exception) -> str:
     """Format an exception in order to use it on a webhook.
 
@@ -314,7 +346,7 @@ def namer(name):
 
 def normalize_request_str(quote: str, lowercase: bool = True) -> str:
     quote = quote.replace("\n", " ")
-    quote = re.sub(" +", " ", quote).strip()
+    quote = _EXTRA_SPACES.sub(" ", quote).strip()
     if lowercase:
         return quote.lower()
 